@@ -15,6 +15,9 @@ import (
 	"github.com/ethereum/go-ethereum/common/compiler"
 )
 
+// solcVersionRegex is used to parse the semantic version string from the output of 'solc --version'.
+var solcVersionRegex = regexp.MustCompile(`\d+\.\d+\.\d+`)
+
 type SolcCompilationConfig struct {
 	Target string `json:"target"`
 }
@@ -47,8 +50,7 @@ func GetSystemSolcVersion() (*semver.Version, error) {
 	}
 
 	// Parse the compiler version out of the output
-	exp := regexp.MustCompile(`\d+\.\d+\.\d+`)
-	versionStr := exp.FindString(string(out))
+	versionStr := solcVersionRegex.FindString(string(out))
 	if versionStr == "" {
 		return nil, errors.New("could not parse solc version using 'solc --version'")
 	}
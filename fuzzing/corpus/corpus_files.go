@@ -6,10 +6,15 @@ import (
 	"github.com/crytic/medusa/utils"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strings"
 	"sync"
 )
 
+// corpusReadThreadsPerCPU describes the amount of corpus files which may be read concurrently per CPU core when
+// loading a corpusDirectory from disk.
+const corpusReadThreadsPerCPU = 4
+
 // corpusFile represents corpus data and its state on the filesystem.
 type corpusFile[T any] struct {
 	// fileName describes the filename the file should be written with, in the corpusDirectory.path.
@@ -33,6 +38,10 @@ type corpusDirectory[T any] struct {
 	// files represents the corpusFile items stored/to be stored in the specified directory.
 	files []*corpusFile[T]
 
+	// filesByName indexes the corpusFile items in files by their lowercase file name, to quickly resolve existing
+	// items when adding or removing files.
+	filesByName map[string]*corpusFile[T]
+
 	// filesLock represents a thread lock used when editing files.
 	filesLock sync.Mutex
 }
@@ -41,8 +50,9 @@ type corpusDirectory[T any] struct {
 // If the directory path is an empty string, then files will not be read from, or written to disk.
 func newCorpusDirectory[T any](path string) *corpusDirectory[T] {
 	return &corpusDirectory[T]{
-		path:  path,
-		files: make([]*corpusFile[T], 0),
+		path:        path,
+		files:       make([]*corpusFile[T], 0),
+		filesByName: make(map[string]*corpusFile[T]),
 	}
 }
 
@@ -57,20 +67,20 @@ func (cd *corpusDirectory[T]) addFile(fileName string, data T) error {
 
 	// First we make sure this file doesn't already exist, if it does, we overwrite its data and mark it unwritten.
 	lowerFileName := strings.ToLower(fileName)
-	for i := 0; i < len(cd.files); i++ {
-		if lowerFileName == strings.ToLower(cd.files[i].fileName) {
-			cd.files[i].data = data
-			cd.files[i].writtenToDisk = false
-			return nil
-		}
+	if existingFile, ok := cd.filesByName[lowerFileName]; ok {
+		existingFile.data = data
+		existingFile.writtenToDisk = false
+		return nil
 	}
 
 	// If the file otherwise did not exist, we add it.
-	cd.files = append(cd.files, &corpusFile[T]{
+	file := &corpusFile[T]{
 		fileName:      fileName,
 		data:          data,
 		writtenToDisk: false,
-	})
+	}
+	cd.files = append(cd.files, file)
+	cd.filesByName[lowerFileName] = file
 	return nil
 }
 
@@ -81,15 +91,22 @@ func (cd *corpusDirectory[T]) removeFile(fileName string) bool {
 	cd.filesLock.Lock()
 	defer cd.filesLock.Unlock()
 
-	// If we find the filename, remove it from our list of files.
+	// If we do not know of the filename, there is nothing to remove.
 	lowerFileName := strings.ToLower(fileName)
+	file, ok := cd.filesByName[lowerFileName]
+	if !ok {
+		return false
+	}
+
+	// Remove it from our index and list of files.
+	delete(cd.filesByName, lowerFileName)
 	for i := 0; i < len(cd.files); i++ {
-		if lowerFileName == strings.ToLower(cd.files[i].fileName) {
+		if cd.files[i] == file {
 			cd.files = append(cd.files[:i], cd.files[i+1:]...)
-			return true
+			break
 		}
 	}
-	return false
+	return true
 }
 
 // readFiles takes a provided glob pattern representing files to parse within the corpusDirectory.path.
@@ -101,40 +118,88 @@ func (cd *corpusDirectory[T]) readFiles(filePattern string) error {
 		return nil
 	}
 
-	// Discover all corpus files in the given directory.
-	filePaths, err := filepath.Glob(filepath.Join(cd.path, filePattern))
-	if err != nil {
+	// Discover all corpus files in the given directory. If the directory does not exist, there are no files to read.
+	dirEntries, err := os.ReadDir(cd.path)
+	if err != nil && !os.IsNotExist(err) {
 		return err
 	}
 
-	// Refresh our files list
-	cd.files = make([]*corpusFile[T], 0)
-
-	// Loop for every file path provided
-	for _, filePath := range filePaths {
-		// Read the file data.
-		b, err := os.ReadFile(filePath)
+	// Collect the paths of all files matching our pattern. The directory entries already describe their file type,
+	// so any directories are skipped without additional stat calls.
+	filePaths := make([]string, 0, len(dirEntries))
+	for _, dirEntry := range dirEntries {
+		if dirEntry.IsDir() {
+			continue
+		}
+		matched, err := filepath.Match(filePattern, dirEntry.Name())
 		if err != nil {
 			return err
 		}
+		if matched {
+			filePaths = append(filePaths, filepath.Join(cd.path, dirEntry.Name()))
+		}
+	}
+
+	// Read and parse all files concurrently, as corpus directories may contain many small files and loading them is
+	// dominated by I/O latency. Each file is stored at its index, so the resulting order matches filePaths.
+	files := make([]*corpusFile[T], len(filePaths))
+	fileErrors := make([]error, len(filePaths))
+	threadReserveChannel := make(chan struct{}, runtime.NumCPU()*corpusReadThreadsPerCPU)
+	var wg sync.WaitGroup
+	for i, filePath := range filePaths {
+		// Reserve a slot in our channel, blocking if we have reached our concurrency limit.
+		threadReserveChannel <- struct{}{}
+		wg.Add(1)
+		go func(i int, filePath string) {
+			defer wg.Done()
+			files[i], fileErrors[i] = readCorpusFile[T](filePath)
+
+			// Free our slot, making way for another file to be read.
+			<-threadReserveChannel
+		}(i, filePath)
+	}
+	wg.Wait()
 
-		// Parse the call sequence data.
-		var fileData T
-		err = json.Unmarshal(b, &fileData)
+	// If any file failed to be read, return the first error encountered (in file order).
+	for _, err := range fileErrors {
 		if err != nil {
 			return err
 		}
+	}
 
-		// Add entry to corpus
-		cd.files = append(cd.files, &corpusFile[T]{
-			fileName:      filepath.Base(filePath),
-			data:          fileData,
-			writtenToDisk: true,
-		})
+	// Refresh our files list and index
+	cd.files = files
+	cd.filesByName = make(map[string]*corpusFile[T], len(files))
+	for _, file := range files {
+		cd.filesByName[strings.ToLower(file.fileName)] = file
 	}
 	return nil
 }
 
+// readCorpusFile reads and parses the file at the provided path into a corpusFile.
+// Returns the corpusFile, or an error if one occurred.
+func readCorpusFile[T any](filePath string) (*corpusFile[T], error) {
+	// Read the file data.
+	b, err := os.ReadFile(filePath)
+	if err != nil {
+		return nil, err
+	}
+
+	// Parse the call sequence data.
+	var fileData T
+	err = json.Unmarshal(b, &fileData)
+	if err != nil {
+		return nil, err
+	}
+
+	// Create our corpus entry
+	return &corpusFile[T]{
+		fileName:      filepath.Base(filePath),
+		data:          fileData,
+		writtenToDisk: true,
+	}, nil
+}
+
 // writeFiles flushes all corpusDirectory.files to disk, if they have corpusFile.writtenToDisk set as false.
 // It then sets corpusFile.writtenToDisk as true for each flushed to disk.
 // Returns an error, if one occurred.
@@ -145,3 +145,28 @@ func TestCorpusCallSequenceMarshaling(t *testing.T) {
 		assert.Empty(t, corpus.mutableSequenceFiles.files)
 	})
 }
+
+// TestCorpusDirectoryFileNames ensures that corpus directory files are resolved by their file name case-insensitively
+// when adding and removing files.
+func TestCorpusDirectoryFileNames(t *testing.T) {
+	// Create a corpus directory which is not backed by disk.
+	corpusDirectory := newCorpusDirectory[calls.CallSequence]("")
+
+	// Add a file, then add it again with a differently cased name, which should overwrite its data.
+	err := corpusDirectory.addFile("sequence.json", getMockCallSequence(1))
+	assert.NoError(t, err)
+	overwrittenSequence := getMockCallSequence(2)
+	err = corpusDirectory.addFile("SEQUENCE.json", overwrittenSequence)
+	assert.NoError(t, err)
+	assert.Len(t, corpusDirectory.files, 1)
+	testCorpusCallSequencesEqual(t, overwrittenSequence, corpusDirectory.files[0].data)
+
+	// Add another file, then remove both using differently cased names.
+	err = corpusDirectory.addFile("other.json", getMockCallSequence(1))
+	assert.NoError(t, err)
+	assert.Len(t, corpusDirectory.files, 2)
+	assert.True(t, corpusDirectory.removeFile("Sequence.JSON"))
+	assert.False(t, corpusDirectory.removeFile("sequence.json"))
+	assert.True(t, corpusDirectory.removeFile("OTHER.json"))
+	assert.Empty(t, corpusDirectory.files)
+}
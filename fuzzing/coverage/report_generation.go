@@ -62,8 +62,8 @@ func exportCoverageReport(sourceAnalysis *SourceAnalysis, outputPath string) err
 			// Determine our precision string
 			formatStr := "%." + strconv.Itoa(decimals) + "f"
 
-			// If no lines are active and none are covered, show 0% coverage
-			if x == 0 && y == 0 {
+			// If no lines are active, show 0% coverage rather than dividing by zero
+			if y == 0 {
 				return fmt.Sprintf(formatStr, float64(0))
 			}
 			return fmt.Sprintf(formatStr, (float64(x)/float64(y))*100)
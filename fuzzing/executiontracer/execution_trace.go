@@ -3,7 +3,6 @@ package executiontracer
 import (
 	"encoding/hex"
 	"fmt"
-	"regexp"
 	"strings"
 
 	"github.com/crytic/medusa/chain"
@@ -109,12 +108,16 @@ func (t *ExecutionTrace) generateCallFrameEnterElements(callFrame *CallFrame) ([
 			// If the call was made to the console log precompile address, let's retrieve the log and format it
 			if callFrame.ToAddress == chain.ConsoleLogContractAddress {
 				// First, attempt to do string formatting if the first element is a string, has a percent sign in it,
-				// and there is at least one argument provided for formatting.
-				exp := regexp.MustCompile(`%`)
-				stringInput, isString := inputValues[0].(string)
-				if isString && exp.MatchString(stringInput) && len(inputValues) > 1 {
+				// and there is at least one argument provided for formatting. The argument count is checked first, so
+				// the first element is only inspected (and a zero-argument log does not index out of range) when needed.
+				var stringInput string
+				isString := false
+				if len(inputValues) > 1 {
+					stringInput, isString = inputValues[0].(string)
+				}
+				if isString && strings.Contains(stringInput, "%") {
 					// Format the string and add it to the list of logs
-					consoleLogString = fmt.Sprintf(inputValues[0].(string), inputValues[1:]...)
+					consoleLogString = fmt.Sprintf(stringInput, inputValues[1:]...)
 				} else {
 					// The string does not need to be formatted, and we can just use the encoded input string
 					consoleLogString = encodedInputString
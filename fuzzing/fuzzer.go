@@ -278,6 +278,11 @@ func (f *Fuzzer) ReportTestCaseFinished(testCase TestCase) {
 // AddCompilationTargets takes a compilation and updates the Fuzzer state with additional Fuzzer.ContractDefinitions
 // definitions and Fuzzer.BaseValueSet values.
 func (f *Fuzzer) AddCompilationTargets(compilations []compilationTypes.Compilation) {
+	// Track source code read from disk and sources seeded into our value set across compilations, as compilation
+	// units commonly share source files.
+	sourceCodeCache := make(map[string][]byte)
+	seededSourcePaths := make(map[string]struct{})
+
 	// Loop for each contract in each compilation and deploy it to the test node.
 	for i := 0; i < len(compilations); i++ {
 		// Add our compilation to the list and get a reference to it.
@@ -286,8 +291,12 @@ func (f *Fuzzer) AddCompilationTargets(compilations []compilationTypes.Compilati
 
 		// Loop for each source
 		for sourcePath, source := range compilation.Sources {
-			// Seed our base value set from every source's AST
-			f.baseValueSet.SeedFromAst(source.Ast)
+			// Seed our base value set from every source's AST. A source shared by multiple compilations yields the
+			// same values, so we only walk its AST once.
+			if _, seeded := seededSourcePaths[sourcePath]; !seeded {
+				f.baseValueSet.SeedFromAst(source.Ast)
+				seededSourcePaths[sourcePath] = struct{}{}
+			}
 
 			// Loop for every contract and register it in our contract definitions
 			for contractName := range source.Contracts {
@@ -297,11 +306,27 @@ func (f *Fuzzer) AddCompilationTargets(compilations []compilationTypes.Compilati
 			}
 		}
 
+		// Reuse any source code already read for a previous compilation, so shared source files are only read once.
+		for sourcePath := range compilation.Sources {
+			if _, ok := compilation.SourceCode[sourcePath]; !ok {
+				if sourceCode, ok := sourceCodeCache[sourcePath]; ok {
+					compilation.SourceCode[sourcePath] = sourceCode
+				}
+			}
+		}
+
 		// Cache all of our source code if it hasn't been already.
 		err := compilation.CacheSourceCode()
 		if err != nil {
 			f.logger.Warn("Failed to cache compilation source file data", err)
 		}
+
+		// Record all successfully read source code for any subsequent compilations.
+		for sourcePath, sourceCode := range compilation.SourceCode {
+			if sourceCode != nil {
+				sourceCodeCache[sourcePath] = sourceCode
+			}
+		}
 	}
 }
 
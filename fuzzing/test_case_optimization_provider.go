@@ -14,6 +14,9 @@ import (
 
 const MIN_INT = "-8000000000000000000000000000000000000000000000000000000000000000"
 
+// minInt256Value is MIN_INT parsed once as a big.Int. Copies of it are handed out, so it is never modified.
+var minInt256Value, _ = new(big.Int).SetString(MIN_INT, 16)
+
 // OptimizationTestCaseProvider is a provider for on-chain optimization tests.
 // Optimization tests are represented as publicly-accessible functions which have a name prefix specified by a
 // config.FuzzingConfig. They take no input arguments and return an integer value that needs to be maximized.
@@ -98,7 +101,7 @@ func (t *OptimizationTestCaseProvider) runOptimizationTest(worker *FuzzerWorker,
 	// If the execution reverted, then we know that we do not have any valuable return data, so we return the smallest
 	// integer value
 	if executionResult.Failed() {
-		minInt256, _ := new(big.Int).SetString(MIN_INT, 16)
+		minInt256 := new(big.Int).Set(minInt256Value)
 		return minInt256, nil, nil
 	}
 
@@ -144,7 +147,7 @@ func (t *OptimizationTestCaseProvider) onFuzzerStarting(event FuzzerStartingEven
 			// Create local variables to avoid pointer types in the loop being overridden.
 			contract := contract
 			method := method
-			minInt256, _ := new(big.Int).SetString(MIN_INT, 16)
+			minInt256 := new(big.Int).Set(minInt256Value)
 
 			// Create our optimization test case
 			optimizationTestCase := &OptimizationTestCase{
@@ -97,25 +97,45 @@ func getAbsoluteValueFromDenominatedValue(number decimal.Decimal, denomination *
 }
 
 // walkAstNodes walks/iterates across an AST for each node, calling the provided walk function with each discovered node
-// as an argument.
+// as an argument. The AST is walked with an explicit stack rather than recursively, as ASTs can be deeply nested.
 func walkAstNodes(ast any, walkFunc func(node map[string]any)) {
-	// Try to parse our node as different types and walk all children.
-	if d, ok := ast.(map[string]any); ok {
-		// If this dictionary contains keys 'id' and 'nodeType', we can assume it's an AST node
-		_, hasId := d["id"]
-		_, hasNodeType := d["nodeType"]
-		if hasId && hasNodeType {
-			walkFunc(d)
-		}
+	// Create a stack of AST elements which are yet to be walked, starting with the root.
+	pending := []any{ast}
+	for len(pending) > 0 {
+		// Pop the next element to walk off the stack.
+		current := pending[len(pending)-1]
+		pending = pending[:len(pending)-1]
 
-		// Walk all keys of the dictionary.
-		for _, v := range d {
-			walkAstNodes(v, walkFunc)
-		}
-	} else if slice, ok := ast.([]any); ok {
-		// Walk all elements of a slice.
-		for _, elem := range slice {
-			walkAstNodes(elem, walkFunc)
+		// Try to parse our element as different types and queue all children to be walked.
+		if d, ok := current.(map[string]any); ok {
+			// If this dictionary contains keys 'id' and 'nodeType', we can assume it's an AST node
+			_, hasId := d["id"]
+			_, hasNodeType := d["nodeType"]
+			if hasId && hasNodeType {
+				walkFunc(d)
+			}
+
+			// Queue all values of the dictionary which may contain further nodes.
+			for _, v := range d {
+				pending = appendAstContainer(pending, v)
+			}
+		} else if slice, ok := current.([]any); ok {
+			// Queue all elements of the slice which may contain further nodes.
+			for _, elem := range slice {
+				pending = appendAstContainer(pending, elem)
+			}
 		}
 	}
 }
+
+// appendAstContainer appends the provided AST element to the given stack if it is a dictionary or slice, as only
+// those may contain AST nodes. Other values are leaves and are skipped.
+// Returns the updated stack.
+func appendAstContainer(pending []any, elem any) []any {
+	switch elem.(type) {
+	case map[string]any, []any:
+		return append(pending, elem)
+	default:
+		return pending
+	}
+}